@@ -1,23 +1,80 @@
 """PathGenerator, contains definition for PathGenerator class"""
 
-from typing import Union
+from collections import OrderedDict
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, List, Match, Optional, Pattern,
+    Tuple, Union,
+)
 from warnings import warn
 
 import os
 import json
+import re
+import sys
 
 
 # This is hacky sorry
 DIRECTORY_KEYWORD = "DIRECTORY_SPECIAL_KEYWORD"
 
+# Sentinel for attributes absent from an attribute dict
+_MISSING = object()
+
+# Default number of generated paths each PathGenerator remembers
+_CACHE_SIZE = 4096
+
+
+def _fstring_text(text: str) -> str:
+    """Escapes literal text for use in a single-quoted f-string
+
+    Parameters
+    ----------
+    text: str
+        The literal text to escape
+
+    Returns
+    -------
+    The escaped text
+    """
+    escaped = text.encode("unicode_escape").decode("ascii")
+    return escaped.replace("'", "\\'").replace("{", "{{").replace("}", "}}")
+
+
+def _collapse(match: Match) -> str:
+    """Replaces a delimiter match from PathGenerator._collapse_re
+
+    Parameters
+    ----------
+    match: re.Match
+        The match of leading or trailing delimiters, or of a repeated
+        delimiter
+
+    Returns
+    -------
+    "" for leading and trailing delimiters, otherwise a single delimiter
+    """
+    return match.group(1) or ""
+
+
+def _uncompiled(attributes: dict) -> Any:
+    """Placeholder for the functions PathGenerator.terminate compiles
+
+    Parameters
+    ----------
+    attributes: dict
+        The attributes which would have been used
+
+    Raises
+    ------
+    ValueError, always
+    """
+    raise ValueError("PathGenerator has not been terminated")
+
 
 class PathGenerator:
     """A class to generate paths from specified attributes
 
     Attributes
     ----------
-    _attributes: dict
-        A dictionary of various attributes and their properties
     _components: list(NameComponent)
         A list of naming components
     _terminated: bool
@@ -30,6 +87,28 @@ class PathGenerator:
         The file separator. Default is platform-specific from os.path.
     _rules: list
         The rules to enforce on passed attributes
+    _last_was_component: bool
+        Whether the last element of _components is a NameComponent
+    _root: str
+        The root directory and file separator prefixed to every path, or ""
+        if paths are relative
+    _compiled: callable
+        The compiled components, built by terminate. Takes the attribute
+        dict and returns the path before repeat delimiters are stripped.
+    _collapse_re: re.Pattern, None
+        Matches leading, trailing and repeated delimiters, or None if
+        generated paths never need stripping
+    _keys: tuple
+        The attribute keys used by the name components, in order
+    _required_keys: frozenset
+        The attribute keys of required name components
+    _get_values: callable
+        Compiled with _compiled. Takes the attribute dict and returns the
+        values of _keys as a tuple, with _MISSING for absent keys.
+    _cache: OrderedDict
+        Recently generated paths, keyed on the values of _keys
+    _cache_size: int
+        The maximum number of paths kept in _cache
 
     Methods
     -------
@@ -38,18 +117,37 @@ class PathGenerator:
     from
     into_attributes
     """
+    __slots__ = (
+        "_components",
+        "_terminated",
+        "_attribute_sep",
+        "_kv_sep",
+        "_file_sep",
+        "_rules",
+        "_last_was_component",
+        "_root",
+        "_compiled",
+        "_collapse_re",
+        "_keys",
+        "_required_keys",
+        "_get_values",
+        "_cache",
+        "_cache_size",
+    )
+
     def __init__(
         self,
-        root: str = "",
+        root: Union[str, os.PathLike, None] = "",
         attribute_sep: str = "_",
         kv_sep: str = "-",
-        file_sep: str = None,
+        file_sep: Optional[str] = None,
+        cache_size: int = _CACHE_SIZE,
     ) -> None:
         """Constructs a new PathGenerator
 
         Parameters
         ----------
-        root: str
+        root: str, os.PathLike
             The root directory which all paths are relative to
         attribute_sep: str, optional
             The default delimeter for attributes. Default "_".
@@ -59,6 +157,10 @@ class PathGenerator:
             The default delimeter for file paths. Default system-dependent.
             ADMONITION: unless you are writing code for another machine, it
             you should probably not override this.
+        cache_size: int, optional
+            The number of generated paths to remember, so that repeated
+            attributes skip rule checks and formatting. Use 0 to disable.
+            Default 4096.
 
         Returns
         -------
@@ -68,31 +170,47 @@ class PathGenerator:
         ------
         TypeError, if anything is the wrong type
         """
-        self._attributes = set()
         self._terminated = False
-        self._attribute_sep = attribute_sep
-        self._kv_sep = kv_sep
+        self._attribute_sep = sys.intern(attribute_sep)
+        self._kv_sep = sys.intern(kv_sep)
         if file_sep is None:
             self._file_sep = os.path.sep
         elif file_sep in ("/", "\\"):
-            self._file_sep = file_sep
+            self._file_sep = sys.intern(file_sep)
         else:
             raise ValueError(
                 f"Specified file separator {file_sep} is not valid for most"
                 " machines, terminating execution."
             )
+        # The root is kept out of delimiter stripping and prefixed as is
+        self._root = ""
+        self._components: list
         if root is None:
             self._components = []
-        elif root == "":
-            self._components = [self._file_sep]
         else:
-            self._components = [root + self._file_sep]
-        self._rules = []
+            root = os.fspath(root)
+            if root == "":
+                self._components = [self._file_sep]
+            else:
+                # A root given with a trailing separator keeps just the one
+                if not root.endswith(self._file_sep):
+                    root = f"{root}{self._file_sep}"
+                self._root = sys.intern(root)
+                self._components = [self._root]
+        self._rules: List[InclusionRule] = []
+        self._last_was_component = False
+        self._compiled: Callable[[dict], str] = _uncompiled
+        self._collapse_re: Optional[Pattern[str]] = None
+        self._keys: Tuple[str, ...] = ()
+        self._required_keys: FrozenSet[str] = frozenset()
+        self._get_values: Callable[[dict], tuple] = _uncompiled
+        self._cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._cache_size = cache_size
 
     def add_component(
         self,
         key: str,
-        delimiter: str = None,
+        delimiter: Optional[str] = None,
         value_only: bool = False,
         required: bool = True,
     ) -> None:
@@ -109,24 +227,19 @@ class PathGenerator:
         value_only: bool, optional
             Whether this name component will print only the value.
         """
-        self._attributes.add(key)
         if delimiter is None:
             delimiter = self._kv_sep
         nc = NameComponent(
             key, delimiter, value_only=value_only, required=required
         )
-        # We have to make sure we don't have 0 elements, or else we'll have
-        # an index error.
-        if len(self._components) == 0:
-            self._components.append(nc)
-        elif isinstance(self._components[-1], NameComponent):
+        if self._last_was_component:
             # Insert the default delimiter between components
             self._components.append(self._attribute_sep)
-            self._components.append(nc)
-        else:
-            # We already have an overridden delimiter, no need to add the
-            # default delimiter
-            self._components.append(nc)
+        # Otherwise this is the first element, or we already have an
+        # overridden delimiter, so no need to add the default delimiter
+        self._components.append(nc)
+        self._last_was_component = True
+        self._recompile()
 
     def delimiter_override(self, delimiter: str) -> None:
         """Adds a delimiter override
@@ -136,16 +249,121 @@ class PathGenerator:
         delimiter: str
             The delimiter to override with
         """
-        self._components.append(delimiter)
+        self._components.append(sys.intern(delimiter))
+        self._last_was_component = False
+        self._recompile()
 
-    def add_filesep(self):
+    def add_filesep(self) -> None:
         """Adds a file separator to the name component list"""
         self._components.append(self._file_sep)
+        self._last_was_component = False
+        self._recompile()
 
-    def terminate(self):
+    def terminate(self) -> None:
         """Terminate the build pattern"""
+        self._compile()
         self._terminated = True
 
+    def _recompile(self) -> None:
+        """Recompile if components change after the builder terminated"""
+        if self._terminated:
+            self._compile()
+
+    def _compile(self) -> None:
+        """Compile the component list into a single path function
+
+        The components become the source of one f-string: literal text is
+        inlined, required components index the attribute dict and optional
+        components are conditional fields. gen_path then does no
+        per-component dispatch at all.
+        """
+        components = self._path_components()
+        self._keys = tuple(dict.fromkeys(
+            c.key for c in components if type(c) is not str
+        ))
+        self._required_keys = frozenset(
+            c.key for c in components
+            if type(c) is not str and c.required
+        )
+        self._cache.clear()
+
+        # Split into the literal text around each name component
+        texts = [""]
+        fields: List[NameComponent] = []
+        for c in components:
+            if type(c) is str:
+                texts[-1] += c
+                continue
+            if c.required and not c.value_only:
+                texts[-1] += c.key + c.kv_delim
+            fields.append(c)
+            texts.append("")
+
+        delimiters = {
+            c if type(c) is str else c.kv_delim for c in components
+        }
+        delimiters.discard("")
+        if delimiters:
+            # Longest first, so a delimiter is never matched by its prefix
+            alternatives = "|".join(
+                re.escape(d)
+                for d in sorted(delimiters, key=len, reverse=True)
+            )
+            collapse_re = re.compile(
+                f"^(?:{alternatives})+|(?:{alternatives})+\\Z"
+                f"|({alternatives})\\1+"
+            )
+        else:
+            collapse_re = None
+        if (
+            collapse_re is not None
+            and all(c.required for c in fields)
+            and not any("\0" in t for t in texts)
+        ):
+            # Without optional components every value fills a fixed slot,
+            # so repeat delimiters can only come from the literal text and
+            # are stripped once here instead of on every call
+            texts = collapse_re.sub(_collapse, "\0".join(texts)).split("\0")
+            collapse_re = None
+        self._collapse_re = collapse_re
+
+        # Keys and prefixes are bound as names, so no attribute text ever
+        # has to be quoted inside the generated expressions
+        namespace: Dict[str, Any] = {"E": ""}
+        source = [_fstring_text(texts[0])]
+        for i, c in enumerate(fields):
+            key = f"K{i}"
+            namespace[key] = c.key
+            if c.required:
+                source.append(f"{{a[{key}]}}")
+            else:
+                prefix = f"P{i}"
+                namespace[prefix] = c._prefix
+                source.append(
+                    f"{{{prefix} if {key} in a else E}}{{a.get({key}, E)}}"
+                )
+            source.append(_fstring_text(texts[i + 1]))
+        self._compiled = eval(
+            compile(
+                "lambda a: f'" + "".join(source) + "'", "<pathgen>", "eval"
+            ),
+            namespace,
+        )
+
+        # The cache key is one tuple display of dict.get calls, rather than
+        # a Python-level loop over the keys on every call
+        namespace["M"] = _MISSING
+        source = []
+        for i, k in enumerate(self._keys):
+            namespace[f"V{i}"] = k
+            source.append(f"a.get(V{i}, M), ")
+        self._get_values = eval(
+            compile(
+                "lambda a: (" + "".join(source) + ")", "<pathgen>", "eval"
+            ),
+            namespace,
+        )
+
     # TODO: create globally required rule
 
     def add_inclusion_rule(
@@ -170,6 +388,8 @@ class PathGenerator:
         # TODO: add logic to make "required" components automatically
         # allowed in all inclusion rules
         self._rules.append(InclusionRule(key, value, attributes))
+        # Cached paths were only checked against the previous rules
+        self._cache.clear()
 
     def gen_path(self, attributes: dict) -> str:
         """Generate a path with this generator and an attribute dict
@@ -183,37 +403,144 @@ class PathGenerator:
         ------
         ValueError if one of the attributes was not supplied to this path
             generator.
+        TypeError if one of the attribute values used is not a str.
+        """
+        self._check_terminated()
+        return self._gen_path(attributes)
+
+    def gen_paths(self, attributes_list: Iterable[dict]) -> List[str]:
+        """Generate paths for a batch of attribute dicts
+
+        Parameters
+        ----------
+        attributes_list: iterable of dict
+            The attributes to use for each path
+
+        Returns
+        -------
+        A list with the path for each attribute dict, in order
+
+        Raises
+        ------
+        ValueError if one of the attributes was not supplied to this path
+            generator.
+        TypeError if one of the attribute values used is not a str.
         """
+        self._check_terminated()
+        # Serve cache hits inline with everything bound to locals; misses
+        # reuse the fetched values rather than repeating the lookup
+        get_values = self._get_values
+        cached = self._cache.get
+        build_path = self._build_path
+        build_and_cache = self._build_and_cache
+        paths: List[str] = []
+        append = paths.append
+        for attributes in attributes_list:
+            values = get_values(attributes)
+            try:
+                path = cached(values)
+            except TypeError:
+                # As in _gen_path, only to raise the str TypeError
+                path = build_path(attributes, values)
+            if path is None:
+                path = build_and_cache(attributes, values)
+            append(path)
+        return paths
+
+    def _check_terminated(self) -> None:
+        """Raise a ValueError if the builder has not been terminated"""
         if not self._terminated:
             raise ValueError(
-                "No path target completed!"
-                "Use the terminate_path method to terminate the builder."
+                "No path target completed! "
+                "Use the terminate method to terminate the builder."
             )
 
-        # subset keys in case extraneous entities are present to only
-        # attributes used to build components
-        subset_keys = (
-            k for k in self._attributes if k in attributes.keys()
-        )
-        subset = {k: attributes[k] for k in subset_keys}
-        for rule in self._rules:
-            rule.check(subset)
+    def _gen_path(self, attributes: dict) -> str:
+        """Generate a path without checking that the builder terminated
 
+        Parameters
+        ----------
+        attributes: dict
+            The attributes to use for this path generator
+        """
+        # Paths depend only on the attributes used by the name components,
+        # so equal values for those give the same path. Directory prefixes
+        # and whole paths repeat heavily across a dataset. Only str values
+        # build a path, so e.g. True and 1 never share a cached entry.
+        values = self._get_values(attributes)
         try:
-            path = "".join(
-                [PathGenerator._str(x, attributes) for x in self._components]
-            )
-        except KeyError:
-            # Apparently KeyError doesn't retain which key failed
-            for k in attributes.keys():
-                if k not in self._attributes:
-                    raise ValueError(f"Attribute {k} is not valid")
+            path = self._cache.get(values)
+        except TypeError:
+            # Unhashable values are never str, so build the path only to
+            # raise its "must be a str" TypeError
+            return self._build_path(attributes, values)
+        if path is None:
+            path = self._build_and_cache(attributes, values)
+        return path
+
+    def _build_and_cache(self, attributes: dict, values: tuple) -> str:
+        """Build a path missing from the cache and remember it
 
-        path = self._strip_repeat_delimiters(path)
+        Parameters
+        ----------
+        attributes: dict
+            The attributes to use for this path generator
+        values: tuple
+            The hashable values of the keys in _keys, or _MISSING for absent
+            keys
 
+        Returns
+        -------
+        The generated path
+        """
+        path = self._build_path(attributes, values)
+        if self._cache_size > 0:
+            cache = self._cache
+            cache[values] = path
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
         return path
 
-    def into_attributes(self, fpath: str, mode: str = "warn"):
+    def _build_path(self, attributes: dict, values: tuple) -> str:
+        """Check the rules and build a path, bypassing the cache
+
+        Parameters
+        ----------
+        attributes: dict
+            The attributes to use for this path generator
+        values: tuple
+            The values of the keys in _keys, or _MISSING for absent keys
+
+        Returns
+        -------
+        The generated path
+        """
+        if self._rules:
+            # subset keys in case extraneous entities are present to only
+            # attributes used to build components, reusing fetched values
+            subset = {
+                k: v for k, v in zip(self._keys, values) if v is not _MISSING
+            }
+            for rule in self._rules:
+                rule.check(subset)
+
+        if self._required_keys - attributes.keys():
+            # Let the name components report the missing attribute
+            for c in self._path_components():
+                if type(c) is not str:
+                    c.name(attributes)
+        for k, v in zip(self._keys, values):
+            # Formatting would otherwise write e.g. None into the path
+            if v is not _MISSING and not isinstance(v, str):
+                raise TypeError(
+                    f"Attribute {k} must be a str, not {type(v).__name__}"
+                )
+        path = self._compiled(attributes)
+        return self._root + self._strip_repeat_delimiters(path)
+
+    def into_attributes(
+        self, fpath: str, mode: str = "warn"
+    ) -> Dict[str, str]:
         """Convert a path into attributes for this convention.
 
         Parameters
@@ -240,34 +567,33 @@ class PathGenerator:
                 f"Mode {mode} is not supported; "
                 f"please use one of {allowed_modes}"
             )
-        atts = {}
+        atts: Dict[str, str] = {}
         remaining = fpath
-        reversed_nc = [x for x in reversed(self._components)]
+        reversed_nc = self._components[::-1]
         for curr, prev in zip(reversed_nc[0:-1:2], reversed_nc[1:-1:2]):
             split = prev
             if not curr.value_only:
                 split += curr.key + curr.kv_delim
-            for sp in [split]:
-                parts = remaining.split(sp)
-                if curr.required and len(parts) == 1:
-                    if mode == "loose":
-                        continue
-                    elif mode == "warn":
-                        warn(
-                            f"Required key {curr.key} not found, "
-                            f"discarded parsed part {parts[-1]}"
-                        )
-                    elif mode == "strict":
-                        raise ValueError(f"Required key {curr.key} not found.")
-                    remaining = sp.join(parts[:-1])
-                elif len(parts) == 1:
-                    _ = 0
-                else:
-                    atts[curr.key] = parts[-1]
-                    remaining = sp.join(parts[:-1])
+            # Only the last occurrence matters, so partition from the right
+            # instead of splitting and re-joining the whole path
+            head, found, tail = remaining.rpartition(split)
+            if found:
+                atts[curr.key] = tail
+                remaining = head
+            elif curr.required:
+                if mode == "loose":
+                    continue
+                elif mode == "warn":
+                    warn(
+                        f"Required key {curr.key} not found, "
+                        f"discarded parsed part {tail}"
+                    )
+                elif mode == "strict":
+                    raise ValueError(f"Required key {curr.key} not found.")
+                remaining = head
         return atts
 
-    def to_dict(self) -> str:
+    def to_dict(self) -> dict:
         """Convert this object into a dictionary
 
         Returns
@@ -279,9 +605,9 @@ class PathGenerator:
         Mostly for serialization into JSON but made public in case you want
         something else.
         """
-        comps = []
+        comps: List[dict] = []
         for c in self._components:
-            if isinstance(c, str):
+            if type(c) is str:
                 if c == self._file_sep:
                     comps.append({"Key": DIRECTORY_KEYWORD})
             else:
@@ -307,11 +633,13 @@ class PathGenerator:
         with open(fname, "w") as f:
             json.dump(self.to_dict(), f)
 
+    @staticmethod
     def from_json(
             fname: str,
-            root: str = "",
-            file_sep: str = None,
-    ):
+            root: Union[str, os.PathLike, None] = "",
+            file_sep: Optional[str] = None,
+            cache_size: int = _CACHE_SIZE,
+    ) -> "PathGenerator":
         """Get a name generator from a JSON file
 
         Parameters
@@ -323,6 +651,8 @@ class PathGenerator:
         file_sep: str
             The file separator of this name generator. Default None,
             which results in automatic choosing.
+        cache_size: int
+            The number of generated paths to remember. Default 4096.
 
         Returns
         -------
@@ -334,7 +664,8 @@ class PathGenerator:
             root=root,
             attribute_sep=this_dict["AttributeSeparator"],
             kv_sep=this_dict["KeyValueSeparator"],
-            file_sep=file_sep
+            file_sep=file_sep,
+            cache_size=cache_size,
         )
         for c in this_dict["Components"]:
             if c["Key"] == DIRECTORY_KEYWORD:
@@ -353,25 +684,11 @@ class PathGenerator:
         ng.terminate()
         return ng
 
-    def _str(o: Union[str, "NameComponent"], att: dict) -> str:
-        """Ingests a string or name component and returns a string
-
-        Parameters
-        ----------
-        o: str | NameComponent
-            The object to turn into a string
-        att: dict
-            The attribute dictionary, in case the object is a NameComponent
-
-        Returns
-        -------
-        The string representation of the object
-        """
-
-        if isinstance(o, str):
-            return o
-        elif isinstance(o, NameComponent):
-            return o.name(att)
+    def _path_components(self) -> list:
+        """Returns the components that follow the root directory, if any"""
+        if self._root:
+            return self._components[1:]
+        return self._components
 
     def _strip_repeat_delimiters(self, path: str) -> str:
         """Ingests a path and strips out repeat delimiters as defined by
@@ -386,17 +703,9 @@ class PathGenerator:
         -------
         A path with no repeat delimiters
         """
-        delimiters = set()
-        for c in self._components:
-            if isinstance(c, str):
-                delimiters.add(c)
-            else:
-                delimiters.add(c.kv_delim)
-        for d in delimiters:
-            if d != "":
-                fields = path.split(d)
-                path = d.join([x for x in fields if x != ""])
-        return path
+        if self._collapse_re is None:
+            return path
+        return self._collapse_re.sub(_collapse, path)
 
 
 class NameComponent:
@@ -442,20 +751,33 @@ class NameComponent:
     requirement hierarchy, and therefore enforce a binary "required" or
     "not required."
     """
+    __slots__ = ("key", "kv_delim", "value_only", "required", "_prefix")
+
     def __init__(
         self,
         key: str,
-        kv_delim: str,
+        kv_delim: Optional[str],
         value_only: bool = False,
         required: bool = True,
     ) -> None:
-        self.key = key
+        # Interned strings let attribute dict lookups hit the identity
+        # fast path
+        self.key = sys.intern(key)
+        if kv_delim is not None:
+            kv_delim = sys.intern(kv_delim)
         self.kv_delim = kv_delim
         self.value_only = value_only
-        if value_only or required:
-            self.required = True
+        self.required = bool(value_only or required)
+        # Cache the key component so name() builds a single f-string
+        if value_only:
+            self._prefix = ""
+        elif kv_delim is None:
+            raise TypeError(
+                f"NameComponent for key {key} requires a str delimiter"
+                " unless value_only is True"
+            )
         else:
-            self.required = False
+            self._prefix = key + kv_delim
 
     def name(self, attributes: dict) -> str:
         """Names a component from the given attributes
@@ -469,25 +791,28 @@ class NameComponent:
         Returns
         -------
         String representing the name component.
+
+        Raises
+        ------
+        ValueError, if a required attribute is missing
+        TypeError, if the attribute value is not a str
         """
-        has_key = self.key in attributes.keys()
-        if self.required and not has_key:
-            raise ValueError(
-                f"NameComponent is required for key {self.key}, but is not"
-                f" present in keys: {', '.join(attributes.keys())}"
-            )
-        if has_key:
-            # Build the value component, which is always needed
-            value = attributes[self.key]
-            # Add key component if needed
-            if self.value_only:
-                component = value
-            else:
-                component = self.key + self.kv_delim + value
-        else:
+        # A single lookup both tests for and fetches the value
+        value = attributes.get(self.key, _MISSING)
+        if value is _MISSING:
+            if self.required:
+                raise ValueError(
+                    f"NameComponent is required for key {self.key}, but is"
+                    f" not present in keys: {', '.join(attributes)}"
+                )
             return ""
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Attribute {self.key} must be a str, not"
+                f" {type(value).__name__}"
+            )
 
-        return component
+        return f"{self._prefix}{value}"
 
     def to_dict(self) -> dict:
         return {
@@ -510,9 +835,11 @@ class InclusionRule:
     includes: set(str)
         The attributes/keys that are compatible with this key-value pair
     """
+    __slots__ = ("key", "value", "includes")
+
     def __init__(
         self, key: str, value: Union[str, list], includes: list
-    ):
+    ) -> None:
         """Constructor for InclusionRule
 
         Parameters
@@ -528,12 +855,10 @@ class InclusionRule:
         self.key = key
         if isinstance(value, str):
             value = [value]
-        value = set(value)
-        self.value = value
-        includes = set(includes)
-        self.includes = includes
+        self.value = set(value)
+        self.includes = set(includes)
 
-    def check(self, attributes: dict):
+    def check(self, attributes: dict) -> None:
         """Checker for the rule
 
         Parameters
@@ -541,18 +866,19 @@ class InclusionRule:
         attributes: dict
             The attributes to check
         """
-        if not (self.key in attributes.keys()):
+        if self.key not in attributes:
             return
         val = attributes[self.key]
         if val not in self.value:
             return
         # The rule applies, make sure that it's enforced
-        for k in attributes.keys():
-            if k not in self.includes:
-                raise ValueError(
-                    f"Rule violation: attribute {k} disallowed for"
-                    f" key {self.key}, value {val}"
-                )
+        disallowed = attributes.keys() - self.includes
+        if disallowed:
+            noun = "attribute" if len(disallowed) == 1 else "attributes"
+            raise ValueError(
+                f"Rule violation: {noun} {', '.join(sorted(disallowed))}"
+                f" disallowed for key {self.key}, value {val}"
+            )
 
     def to_dict(self) -> dict:
         return {
@@ -563,4 +889,4 @@ class InclusionRule:
 
 
 class RequirementRule:
-    pass
+    __slots__ = ()
@@ -1,6 +1,8 @@
 from archivotron import PathGenerator
+from archivotron.PathGenerator import NameComponent
 
 import os
+import pathlib
 import pytest
 
 
@@ -10,6 +12,32 @@ def test_constructor():
     assert pg is not None
 
 
+def test_root():
+    """Makes sure roots, including os.PathLike ones, prefix the path"""
+    pg = PathGenerator(pathlib.PurePath("data"))
+    pg.add_component("sub")
+    pg.terminate()
+
+    assert pg.gen_path({"sub": "01"}) == f"data{os.sep}sub-01"
+
+    pg = PathGenerator("/data/project")
+    pg.add_component("sub")
+    pg.add_filesep()
+    pg.add_component("sub")
+    pg.add_component("ses", required=False)
+    pg.terminate()
+
+    expected = f"/data/project{os.sep}sub-01{os.sep}sub-01"
+    assert pg.gen_path({"sub": "01"}) == expected
+
+    # A trailing separator on the root is not doubled
+    for root, expected in (("/data/", "/data/sub-01"), ("/", "/sub-01")):
+        pg = PathGenerator(root, file_sep="/")
+        pg.add_component("sub")
+        pg.terminate()
+        assert pg.gen_path({"sub": "01"}) == expected
+
+
 def test_gen_path_succeeds():
     """Tests for gen_path successes"""
     pg = PathGenerator()
@@ -156,6 +184,20 @@ def test_gen_path_succeeds():
         atts["suffix"] = "sbref"
         bids.gen_path(atts)
 
+    with pytest.raises(
+        ValueError,
+        match=r"^Rule violation: attributes inv, recording disallowed"
+    ):
+        atts["inv"] = "1"
+        bids.gen_path(atts)
+
+    # Delimiters before a trailing newline in a value are kept
+    pg = PathGenerator()
+    pg.add_component("sub")
+    pg.add_component("acq", required=False)
+    pg.terminate()
+    assert pg.gen_path({"sub": "01", "acq": "x_\n"}) == "sub-01_acq-x_\n"
+
 
 def test_gen_path_fails():
     """Tests for gen_path failures"""
@@ -166,8 +208,28 @@ def test_gen_path_fails():
         pg.gen_path({"subject": "Jen"})
 
     pg.add_component("subject")
+    pg.add_component("acq", required=False)
+    pg.add_component("suffix", value_only=True)
     pg.terminate()
 
+    # Should fail because values are not strings
+    for value in (None, 1, 1.5, ["01"]):
+        for key in ("subject", "acq", "suffix"):
+            atts = {"subject": "Jen", "suffix": "T1w", key: value}
+            with pytest.raises(TypeError, match=rf"^Attribute {key} must"):
+                pg.gen_path(atts)
+            with pytest.raises(TypeError, match=rf"^Attribute {key} must"):
+                pg.gen_paths([atts])
+        with pytest.raises(TypeError, match=r"^Attribute subject must"):
+            NameComponent("subject", "-").name({"subject": value})
+
+    # Should fail because a key-value component has no delimiter
+    with pytest.raises(TypeError, match=r"requires a str delimiter"):
+        NameComponent("subject", None)
+    assert NameComponent("subject", None, value_only=True).name(
+        {"subject": "Jen"}
+    ) == "Jen"
+
 
 def test_json():
     # BIDS T1w anatomical, func
@@ -221,3 +283,154 @@ def test_json():
     os.remove(temp_name)
 
     assert bids.gen_path(atts) == bids_from_file.gen_path(atts)
+
+
+def test_gen_path_all_required():
+    """Tests generators whose components are all required"""
+    pg = PathGenerator(None)
+    pg.add_component("sub")
+    pg.delimiter_override("{x}")
+    pg.add_component("task", value_only=True)
+    pg.terminate()
+
+    assert pg.gen_path({"sub": "01", "task": "rest"}) == "sub-01{x}rest"
+
+    with pytest.raises(
+        ValueError,
+        match=r"^NameComponent is required for key task*"
+    ):
+        pg.gen_path({"sub": "01"})
+
+
+def test_gen_paths():
+    """Tests for batch path generation"""
+    pg = PathGenerator()
+    pg.add_component("sub")
+    pg.add_filesep()
+    pg.add_component("ses", required=False)
+    pg.add_filesep()
+    pg.add_component("sub")
+    pg.add_component("ses", required=False)
+    pg.add_component("suffix", value_only=True)
+
+    with pytest.raises(ValueError, match=r"^No path target completed!*"):
+        pg.gen_paths([{"sub": "01", "suffix": "T1w"}])
+
+    pg.terminate()
+
+    rows = [
+        {"sub": "01", "suffix": "T1w"},
+        {"sub": "01", "ses": "pre", "suffix": "T1w"},
+        {"sub": "02", "ses": "post", "suffix": "T2w"},
+    ]
+    expected = [
+        "sub-01/sub-01_T1w",
+        "sub-01/ses-pre/sub-01_ses-pre_T1w",
+        "sub-02/ses-post/sub-02_ses-post_T2w",
+    ]
+    assert pg.gen_paths(rows) == expected
+    assert pg.gen_paths(iter(rows)) == [pg.gen_path(r) for r in rows]
+    assert pg.gen_paths([]) == []
+
+
+def test_gen_path_cache():
+    """Tests that remembered paths stay consistent with the generator"""
+    pg = PathGenerator()
+    pg.add_component("sub")
+    pg.add_component("acq", required=False)
+    pg.add_component("suffix", value_only=True)
+    pg.terminate()
+
+    atts = {"sub": "01", "acq": "a", "suffix": "bold"}
+    assert pg.gen_path(atts) == "sub-01_acq-a_bold"
+    assert pg.gen_path(dict(atts)) == "sub-01_acq-a_bold"
+    # Extraneous attributes do not change the path
+    assert pg.gen_path({**atts, "extra": "x"}) == "sub-01_acq-a_bold"
+    del atts["acq"]
+    assert pg.gen_path(atts) == "sub-01_bold"
+
+    # A rule added after paths were generated still applies to them
+    pg.add_inclusion_rule("suffix", "bold", ["sub", "suffix"])
+    assert pg.gen_path(atts) == "sub-01_bold"
+    with pytest.raises(ValueError, match=r"Rule violation*"):
+        pg.gen_path({"sub": "01", "acq": "a", "suffix": "bold"})
+
+
+def test_add_after_terminate():
+    """Tests that components added after terminate change the path"""
+    pg = PathGenerator()
+    pg.add_component("sub")
+    pg.terminate()
+    assert pg.gen_path({"sub": "01", "ses": "a"}) == "sub-01"
+
+    pg.add_component("ses")
+    assert pg.gen_path({"sub": "01", "ses": "a"}) == "sub-01_ses-a"
+    pg.delimiter_override("+")
+    pg.add_component("run", required=False)
+    assert pg.gen_path({"sub": "01", "ses": "a"}) == "sub-01_ses-a"
+    assert pg.gen_path({"sub": "01", "ses": "a", "run": "1"}) == (
+        "sub-01_ses-a+run-1"
+    )
+    pg.add_filesep()
+    pg.add_component("suffix", value_only=True)
+    assert pg.gen_path(
+        {"sub": "01", "ses": "a", "run": "1", "suffix": "bold"}
+    ) == f"sub-01_ses-a+run-1{os.sep}bold"
+
+
+def test_gen_path_cache_size():
+    """Tests generators with small or disabled caches"""
+    for cache_size in (0, 1, 2):
+        pg = PathGenerator(cache_size=cache_size)
+        pg.add_component("sub")
+        pg.add_component("run", required=False)
+        pg.terminate()
+
+        for _ in range(2):
+            assert pg.gen_path({"sub": "01"}) == "sub-01"
+            assert pg.gen_path({"sub": "02", "run": "1"}) == "sub-02_run-1"
+            assert pg.gen_paths([{"sub": "03"}]) == ["sub-03"]
+        # Three distinct paths were generated, so the cache is full
+        assert len(pg._cache) == cache_size
+        if cache_size == 0:
+            assert not pg._cache
+
+
+def test_gen_path_cache_equal_values():
+    """Tests that equal values of other types never hit a cached path"""
+    for cache_size in (0, 4096):
+        pg = PathGenerator(cache_size=cache_size)
+        pg.add_component("run")
+        pg.terminate()
+
+        assert pg.gen_path({"run": "1"}) == "run-1"
+        for value in (True, 1, 1.0, True):
+            with pytest.raises(TypeError, match=r"^Attribute run must"):
+                pg.gen_path({"run": value})
+            with pytest.raises(TypeError, match=r"^Attribute run must"):
+                pg.gen_paths([{"run": "1"}, {"run": value}])
+        assert pg.gen_paths([{"run": "1"}]) == ["run-1"]
+
+
+def test_gen_path_unhashable():
+    """Tests that unhashable values raise the same error with the cache"""
+    def outcome(gen, arg):
+        try:
+            return gen(arg)
+        except Exception as e:
+            return type(e), str(e)
+
+    cached = PathGenerator()
+    uncached = PathGenerator(cache_size=0)
+    for pg in (cached, uncached):
+        pg.add_component("sub")
+        pg.add_component("run", required=False)
+        pg.terminate()
+
+    for atts in ({"sub": ["01"]}, {"sub": "01", "run": {"1": "2"}}):
+        error = outcome(uncached.gen_path, atts)
+        assert error[0] is TypeError and "must be a str" in error[1]
+        assert outcome(cached.gen_path, atts) == error
+        assert outcome(cached.gen_paths, [atts]) == (
+            outcome(uncached.gen_paths, [atts])
+        )